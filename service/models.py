@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import lambda_stmt, select
 
 logger = logging.getLogger("flask.app")
 
@@ -45,6 +46,11 @@ def init_db(app):
     Product.init_db(app)
 
 
+def _parse_price(price: str) -> Decimal:
+    """Converts a price string that may be padded or quoted to a Decimal"""
+    return Decimal(price.strip(' "'))
+
+
 class DataValidationError(Exception):
     """Used for an data validation errors when deserializing"""
 
@@ -173,7 +179,7 @@ class Product(db.Model):
     def all(cls) -> list:
         """Returns all of the Products in the database"""
         logger.info("Processing all Products")
-        return cls.query.all()
+        return db.session.execute(lambda_stmt(lambda: select(cls))).scalars().all()
 
     @classmethod
     def find(cls, product_id: int):
@@ -187,7 +193,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
+        return db.session.get(cls, product_id)
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
@@ -201,7 +207,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        return db.session.execute(lambda_stmt(lambda: select(cls).where(cls.name == name))).scalars().all()
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -217,8 +223,8 @@ class Product(db.Model):
         logger.info("Processing price query for %s ...", price)
         price_value = price
         if isinstance(price, str):
-            price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+            price_value = _parse_price(price)
+        return db.session.execute(lambda_stmt(lambda: select(cls).where(cls.price == price_value))).scalars().all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +238,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        return db.session.execute(lambda_stmt(lambda: select(cls).where(cls.available == available))).scalars().all()
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +252,4 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        return db.session.execute(lambda_stmt(lambda: select(cls).where(cls.category == category))).scalars().all()